@@ -2,19 +2,26 @@
 
 from __future__ import annotations
 import argparse
+import csv
 import logging
+import mmap
+import os
 import re
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Tuple
-import pandas as pd
-from xml.sax.saxutils import escape
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 
 
 DEFAULT_METADATA_CSV = "Cor_META_updated.csv"
 DEFAULT_TEXTS_DIR = "500_numbered"
 DEFAULT_OUTPUT_XML = "CORHOH.xml"
+# Transcripts larger than this are decoded from an mmap instead of read().
+MMAP_MIN_BYTES = 64 * 1024
 
 
 @dataclass(frozen=True)
@@ -31,9 +38,47 @@ class Indent:
 
 
 IND = Indent()
-
-_Q_RE = re.compile(r"^\s*Q(\d+)\s*:\s*(.*)\s*$")
-_A_RE = re.compile(r"^\s*A(\d+)\s*:\s*(.*)\s*$")
+# Plain module-level copies of the indent strings for the hot formatting paths.
+_CORHOH, _TEXT, _L2, _L3, _L4, _L5, _L6 = IND.CORHOH, IND.TEXT, IND.L2, IND.L3, IND.L4, IND.L5, IND.L6
+
+# A "Q<n>:" / "A<n>:" marker at the start of a line. It is anchored on a literal
+# newline rather than "^" so the regex engine can skip straight to line starts;
+# parse_transcript_to_turns first rejoins the lines with "\n", so CR, CRLF and
+# the other str.splitlines() boundaries all end up as that newline.
+# Indentation around the marker may be any non-line-breaking Unicode space
+# (what \s matched within a single line), e.g. NBSP from the cp1252 fallback.
+# Turn numbers are ASCII, so \d should not match other Unicode digits.
+# Stdlib re is deliberate: google-re2 ran this split about 10x slower on the
+# corpus, since its wrapper re-encodes the non-ASCII transcripts per call.
+# Exactly the characters for which str.isspace() is true but str.splitlines()
+# does not break a line.
+_HSPACE = r"[\t\x1f \xa0\u1680\u2000-\u200a\u202f\u205f\u3000]"
+_TURN_RE = re.compile(rf"\n{_HSPACE}*([QA])(\d+){_HSPACE}*:{_HSPACE}*", re.ASCII)
+assert _TURN_RE.flags & re.ASCII, "_TURN_RE must be compiled with re.ASCII"
+
+# Legacy corruption artifacts observed in this dataset, replaced in order.
+_ARTIFACT_REPLACEMENTS: Tuple[Tuple[str, str], ...] = (
+    ("Õ", "'"),
+    ("Ô", "'"),
+    ("Ò", '"'),
+    ("Ó", '"'),
+    ("Ñ", "—"),
+    ("‹", "ã"),
+    ("√ït", "'t"),
+    ("√ïs", "'s"),
+    ("√ïll", "'ll"),
+    ("√ï", "'"),
+)
+
+
+def _xesc(s: str) -> str:
+    """Escape &, < and > for XML text (same output as saxutils.escape).
+
+    Chained str.replace keeps each step a C-level scan that returns the input
+    unchanged when there is nothing to replace; str.translate with entity
+    strings would fall back to a per-character Python mapping lookup.
+    """
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
 def configure_logging(verbosity: int) -> None:
@@ -50,6 +95,13 @@ def configure_logging(verbosity: int) -> None:
     )
 
 
+def _decode_transcript(raw: bytes | mmap.mmap) -> str:
+    try:
+        return str(raw, "utf-8-sig")
+    except UnicodeDecodeError:
+        return str(raw, "cp1252", "replace")
+
+
 def smart_read(path: Path) -> str:
     """Read transcript text with a pragmatic encoding fallback and cleanup.
 
@@ -57,33 +109,26 @@ def smart_read(path: Path) -> str:
     common legacy corruption artifacts observed in this dataset.
     """
 
-    raw = path.read_bytes()
-    try:
-        content = raw.decode("utf-8-sig")
-    except UnicodeDecodeError:
-        content = raw.decode("cp1252", errors="replace")
-    replacements = {
-        "Õ": "'",
-        "Ô": "'",
-        "Ò": '"',
-        "Ó": '"',
-        "Ñ": "—",
-        "‹": "ã",
-        "√ït": "'t",
-        "√ïs": "'s",
-        "√ïll": "'ll",
-        "√ï": "'",
-    }
-
-    for old, new in replacements.items():
-        if old in content:
-            content = content.replace(old, new)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > MMAP_MIN_BYTES:
+            # Decode straight from the mapped pages rather than copying into bytes.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = _decode_transcript(mm)
+        else:
+            content = _decode_transcript(f.read())
+    for old, new in _ARTIFACT_REPLACEMENTS:
+        content = content.replace(old, new)
 
     return content
 
 
-def fixed_header_block(total_q: int, total_a: int, nl: str = "\n") -> str:
-    """Create the TEI header block with dynamic Q/A counts."""
+@lru_cache(maxsize=None)
+def _header_template(nl: str) -> str:
+    """Build the TEI header once per newline style as a %-format string.
+
+    The four ``%d`` slots are the question and answer totals, in the abstract
+    and again in the revision note.
+    """
 
     abstract_text = (
         "CORHOH (Text Corpus of Holocaust Oral Histories) comprises 500 oral histories "
@@ -93,199 +138,308 @@ def fixed_header_block(total_q: int, total_a: int, nl: str = "\n") -> str:
         "material has been removed, and each interviewer question and survivor answer "
         "has been assigned a unique identifier. The corpus follows TEI guidelines "
         "(TEI Consortium 2023). In this version, the dataset contains "
-        f"{total_q} questions and {total_a} answers, providing a substantial "
+        "%d questions and %d answers, providing a substantial "
         "interdisciplinary resource for research in the humanities and social sciences. "
         "CORHOH is sourced from the United States Holocaust Memorial Museum (USHMM) "
         "and is publicly available under a CC BY-NC-SA 4.0 license."
     )
 
     return (
-        f"{IND.CORHOH}<teiHeader>{nl}"
-        f"{IND.TEXT}<fileDesc>{nl}"
-        f"{IND.L2}<titleStmt>{nl}"
-        f"{IND.L3}<title>CORHOH: Text Corpus of Holocaust Oral Histories</title>{nl}"
-        f"{IND.L3}<respStmt>{nl}"
-        f"{IND.L4}<resp>Mendeley Repository: https://data.mendeley.com/datasets/gz7v268252/2</resp>{nl}"
-        f"{IND.L3}</respStmt>{nl}"
-        f"{IND.L2}</titleStmt>{nl}"
-        f"{IND.L2}<publicationStmt>{nl}"
-        f"{IND.L3}<publisher>Data in Brief: https://www.sciencedirect.com/science/article/pii/S2352340925001581</publisher>{nl}"
-        f"{IND.L3}<date>2025</date>{nl}"
-        f"{IND.L3}<availability>{nl}"
-        f"{IND.L4}<licence>All data used in this study comply with ethical guidelines of the United States Holocaust Memorial Museum (https://www.ushmm.org/copyright-and-legal-information/terms-of-use), and the oral histories included in the CORHOH corpus are publicly available under the CC BY-NC-SA 4.0 license.</licence>{nl}"
-        f"{IND.L3}</availability>{nl}"
-        f"{IND.L2}</publicationStmt>{nl}"
-        f"{IND.L2}<sourceDesc>{nl}"
-        f"{IND.L3}<bibl>{nl}"
-        f"{IND.L4}<title>CORHOH</title>{nl}"
-        f"{IND.L4}<author>Daban Q. Jaff</author>{nl}"
-        f"{IND.L4}<pubPlace>Universität Erfurt, Philosophische Fakultät</pubPlace>{nl}"
-        f"{IND.L4}<date>2025</date>{nl}"
-        f"{IND.L3}</bibl>{nl}"
-        f"{IND.L3}<p>Data collected from oral history interviews from Let Them Speak: https://lts.fortunoff.library.yale.edu/about</p>{nl}"
-        f"{IND.L2}</sourceDesc>{nl}"
-        f"{IND.TEXT}</fileDesc>{nl}"
-        f"{IND.TEXT}<profileDesc>{nl}"
-        f"{IND.L2}<abstract>{escape(abstract_text)}</abstract>{nl}"
-        f"{IND.TEXT}</profileDesc>{nl}"
-        f"{IND.TEXT}<revisionDesc>{nl}"
-        f"{IND.L2}<change when=\"2025-02-01\">Initial TEI encoding applied.</change>{nl}"
-        f"{IND.L2}<change when=\"2026-01-19\">Modified release: corrected a duplicate inclusion; this version contains one oral history per survivor across the 500 records. Counts updated to {total_q} questions and {total_a} answers.</change>{nl}"
-        f"{IND.TEXT}</revisionDesc>{nl}"
-        f"{IND.CORHOH}</teiHeader>{nl}"
+        f"{_CORHOH}<teiHeader>{nl}"
+        f"{_TEXT}<fileDesc>{nl}"
+        f"{_L2}<titleStmt>{nl}"
+        f"{_L3}<title>CORHOH: Text Corpus of Holocaust Oral Histories</title>{nl}"
+        f"{_L3}<respStmt>{nl}"
+        f"{_L4}<resp>Mendeley Repository: https://data.mendeley.com/datasets/gz7v268252/2</resp>{nl}"
+        f"{_L3}</respStmt>{nl}"
+        f"{_L2}</titleStmt>{nl}"
+        f"{_L2}<publicationStmt>{nl}"
+        f"{_L3}<publisher>Data in Brief: https://www.sciencedirect.com/science/article/pii/S2352340925001581</publisher>{nl}"
+        f"{_L3}<date>2025</date>{nl}"
+        f"{_L3}<availability>{nl}"
+        f"{_L4}<licence>All data used in this study comply with ethical guidelines of the United States Holocaust Memorial Museum (https://www.ushmm.org/copyright-and-legal-information/terms-of-use), and the oral histories included in the CORHOH corpus are publicly available under the CC BY-NC-SA 4.0 license.</licence>{nl}"
+        f"{_L3}</availability>{nl}"
+        f"{_L2}</publicationStmt>{nl}"
+        f"{_L2}<sourceDesc>{nl}"
+        f"{_L3}<bibl>{nl}"
+        f"{_L4}<title>CORHOH</title>{nl}"
+        f"{_L4}<author>Daban Q. Jaff</author>{nl}"
+        f"{_L4}<pubPlace>Universität Erfurt, Philosophische Fakultät</pubPlace>{nl}"
+        f"{_L4}<date>2025</date>{nl}"
+        f"{_L3}</bibl>{nl}"
+        f"{_L3}<p>Data collected from oral history interviews from Let Them Speak: https://lts.fortunoff.library.yale.edu/about</p>{nl}"
+        f"{_L2}</sourceDesc>{nl}"
+        f"{_TEXT}</fileDesc>{nl}"
+        f"{_TEXT}<profileDesc>{nl}"
+        f"{_L2}<abstract>{_xesc(abstract_text)}</abstract>{nl}"
+        f"{_TEXT}</profileDesc>{nl}"
+        f"{_TEXT}<revisionDesc>{nl}"
+        f"{_L2}<change when=\"2025-02-01\">Initial TEI encoding applied.</change>{nl}"
+        f"{_L2}<change when=\"2026-01-19\">Modified release: corrected a duplicate inclusion; this version contains one oral history per survivor across the 500 records. Counts updated to %d questions and %d answers.</change>{nl}"
+        f"{_TEXT}</revisionDesc>{nl}"
+        f"{_CORHOH}</teiHeader>{nl}"
     )
 
 
+def fixed_header_block(total_q: int, total_a: int, nl: str = "\n") -> str:
+    """Create the TEI header block with dynamic Q/A counts."""
+
+    return _header_template(nl) % (total_q, total_a, total_q, total_a)
+
+
+# Cell values treated as missing (the same defaults pandas.read_csv uses).
+_NA_VALUES = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+})
+
+# Metadata columns in the order build_record_xml expects them.
+RECORD_FIELDS: Tuple[str, ...] = (
+    "Documents ID",
+    "Rec_Date",
+    "Length",
+    "A_#",
+    "Q_#",
+    "permission_type",
+    "Link",
+    "Name",
+    "DOB",
+    "Gender",
+    "Born",
+    "Ghetto",
+    "Camp",
+    "Imm_Date",
+    "Imm_Destination",
+)
+
 Turn = Tuple[str, str, str]
 
+_ROLE = {"question": "interviewer", "answer": "interviewee"}
 
-def parse_transcript_to_turns(text: str) -> List[Turn]:
 
-    turns: List[Turn] = []
-    cur_type: str | None = None
-    cur_label: str | None = None
-    cur_buf: List[str] = []
+def parse_transcript_to_turns(text: str) -> List[Turn]:
+    """Split a transcript into (type, label, utterance) turns in one regex pass.
 
-    def flush() -> None:
-        nonlocal cur_type, cur_label, cur_buf
-        if cur_type is None:
-            return
-        turns.append((cur_type, cur_label or "", "\n".join(cur_buf).strip()))
+    Everything between a ``Q<n>:``/``A<n>:`` marker and the next marker is the
+    utterance body; text before the first marker is ignored.
+    """
 
-    for raw_line in text.splitlines():
-        line = raw_line.rstrip("\n")
-        m_q = _Q_RE.match(line)
-        m_a = _A_RE.match(line)
+    # [preamble, kind, number, body, kind, number, body, ...]
+    parts = _TURN_RE.split("\n" + "\n".join(text.splitlines()))
+    return [
+        ("question" if kind == "Q" else "answer", kind + num, body.strip())
+        for kind, num, body in zip(parts[1::3], parts[2::3], parts[3::3])
+    ]
 
-        if m_q:
-            flush()
-            cur_type = "question"
-            cur_label = "Q" + m_q.group(1)
-            cur_buf = [m_q.group(2)]
-            continue
 
-        if m_a:
-            flush()
-            cur_type = "answer"
-            cur_label = "A" + m_a.group(1)
-            cur_buf = [m_a.group(2)]
-            continue
+@lru_cache(maxsize=4096)
+def _field_text(value: str) -> str:
+    """Strip and escape a metadata value; values like Gender or Born repeat a lot."""
+    return _xesc(value.strip())
 
-        if cur_type is not None:
-            cur_buf.append(line)
 
-    flush()
-    return turns
+@lru_cache(maxsize=None)
+def _record_template(nl: str) -> Callable[..., str]:
+    """Build the constant record skeleton once per newline style.
 
+    Returns a bound ``str.format`` taking the escaped RECORD_FIELDS values
+    positionally and the rendered turns as ``body``.
+    """
 
-def build_record_xml(row: Dict[str, str], transcript_text: str, nl: str = "\n") -> Tuple[str, int, int]:
-   
+    record = (
+        f"{_TEXT}<text id=\"{{0}}\">{nl}"
+        f"{_L2}<meta>{nl}"
+        f"{_L3}<Oral_History_Details>{nl}"
+        f"{_L4}<Documents_ID>{{0}}</Documents_ID>{nl}"
+        f"{_L4}<Rec_Date>{{1}}</Rec_Date>{nl}"
+        f"{_L4}<Rec_Length>{{2}}</Rec_Length>{nl}"
+        f"{_L4}<A_Number>{{3}}</A_Number>{nl}"
+        f"{_L4}<Q_Number>{{4}}</Q_Number>{nl}"
+        f"{_L4}<permission_type>{{5}}</permission_type>{nl}"
+        f"{_L4}<Link>{{6}}</Link>{nl}"
+        f"{_L3}</Oral_History_Details>{nl}"
+        f"{_L3}<Individual_Meta_Data>{nl}"
+        f"{_L4}<Name>{{7}}</Name>{nl}"
+        f"{_L4}<DOB>{{8}}</DOB>{nl}"
+        f"{_L4}<Gender>{{9}}</Gender>{nl}"
+        f"{_L4}<Born>{{10}}</Born>{nl}"
+        f"{_L4}<Ghetto>{{11}}</Ghetto>{nl}"
+        f"{_L4}<Camp>{{12}}</Camp>{nl}"
+        f"{_L4}<Imm_Date>{{13}}</Imm_Date>{nl}"
+        f"{_L4}<Imm_Destination>{{14}}</Imm_Destination>{nl}"
+        f"{_L3}</Individual_Meta_Data>{nl}"
+        f"{_L2}</meta>{nl}"
+        f"{_L2}<text>{nl}"
+        f"{_L3}<body>{nl}"
+        f"{_L4}<div type=\"interview\">{nl}"
+        f"{_L5}<head>Interview Transcript</head>{nl}"
+        "{body}"
+        f"{_L4}</div>{nl}"
+        f"{_L3}</body>{nl}"
+        f"{_L2}</text>{nl}"
+        f"{_TEXT}</text>"
+    )
+    return record.format
 
-    def field(key: str) -> str:
-        return escape(str(row.get(key, "")).strip())
 
-    doc_id = field("Documents ID")
+def build_record_xml(values: Sequence[str], transcript_text: str, nl: str = "\n") -> Tuple[str, int, int]:
+    record_tmpl = _record_template(nl)
+    fields = [_field_text(v) for v in values]
     turns = parse_transcript_to_turns(transcript_text)
 
-    div_blocks: List[str] = []
+    # Collect every turn fragment in one flat list and join once at the end.
+    # Loop-invariant lookups are bound to locals first. Labels come from _TURN_RE
+    # as [QA]<digits>, so only the utterance needs escaping.
+    L5, L6 = _L5, _L6
+    role_of = _ROLE.__getitem__
+    esc = _xesc
+    parts: List[str] = []
+    extend = parts.extend
+    q_count = 0
     for ttype, label, utt in turns:
-        role = "interviewer" if ttype == "question" else "interviewee"
-        div_blocks.append(
-            f"{IND.L5}<div type=\"{ttype}\">{nl}"
-            f"{IND.L6}<speaker role=\"{role}\">{escape(label)}</speaker>{nl}"
-            f"{IND.L6}<u>{escape(utt)}</u>{nl}"
-            f"{IND.L5}</div>"
-        )
+        q_count += ttype == "question"
+        extend((
+            L5, "<div type=\"", ttype, "\">", nl,
+            L6, "<speaker role=\"", role_of(ttype), "\">", label, "</speaker>", nl,
+            L6, "<u>", esc(utt), "</u>", nl,
+            L5, "</div>", nl,
+        ))
 
-    xml = (
-        f"{IND.TEXT}<text id=\"{doc_id}\">{nl}"
-        f"{IND.L2}<meta>{nl}"
-        f"{IND.L3}<Oral_History_Details>{nl}"
-        f"{IND.L4}<Documents_ID>{doc_id}</Documents_ID>{nl}"
-        f"{IND.L4}<Rec_Date>{field('Rec_Date')}</Rec_Date>{nl}"
-        f"{IND.L4}<Rec_Length>{field('Length')}</Rec_Length>{nl}"
-        f"{IND.L4}<A_Number>{field('A_#')}</A_Number>{nl}"
-        f"{IND.L4}<Q_Number>{field('Q_#')}</Q_Number>{nl}"
-        f"{IND.L4}<permission_type>{field('permission_type')}</permission_type>{nl}"
-        f"{IND.L4}<Link>{field('Link')}</Link>{nl}"
-        f"{IND.L3}</Oral_History_Details>{nl}"
-        f"{IND.L3}<Individual_Meta_Data>{nl}"
-        f"{IND.L4}<Name>{field('Name')}</Name>{nl}"
-        f"{IND.L4}<DOB>{field('DOB')}</DOB>{nl}"
-        f"{IND.L4}<Gender>{field('Gender')}</Gender>{nl}"
-        f"{IND.L4}<Born>{field('Born')}</Born>{nl}"
-        f"{IND.L4}<Ghetto>{field('Ghetto')}</Ghetto>{nl}"
-        f"{IND.L4}<Camp>{field('Camp')}</Camp>{nl}"
-        f"{IND.L4}<Imm_Date>{field('Imm_Date')}</Imm_Date>{nl}"
-        f"{IND.L4}<Imm_Destination>{field('Imm_Destination')}</Imm_Destination>{nl}"
-        f"{IND.L3}</Individual_Meta_Data>{nl}"
-        f"{IND.L2}</meta>{nl}"
-        f"{IND.L2}<text>{nl}"
-        f"{IND.L3}<body>{nl}"
-        f"{IND.L4}<div type=\"interview\">{nl}"
-        f"{IND.L5}<head>Interview Transcript</head>{nl}"
-        + (f"{nl}".join(div_blocks) + (nl if div_blocks else ""))
-        + f"{IND.L4}</div>{nl}"
-        f"{IND.L3}</body>{nl}"
-        f"{IND.L2}</text>{nl}"
-        f"{IND.TEXT}</text>"
-    )
+    xml = record_tmpl(*fields, body="".join(parts))
 
-    q_count = sum(1 for t in turns if t[0] == "question")
-    a_count = sum(1 for t in turns if t[0] == "answer")
+    a_count = len(turns) - q_count
     return xml, q_count, a_count
 
 
-def read_metadata(metadata_csv: Path) -> pd.DataFrame:
-    df = pd.read_csv(metadata_csv, sep=None, engine="python", dtype=str).fillna("")
-    if "Documents ID" not in df.columns:
-        raise KeyError("Metadata file must contain a 'Documents ID' column.")
-    return df
+def detect_delimiter(metadata_csv: Path, candidates: str = ",;\t") -> str:
+    """Pick the candidate delimiter that occurs most often in the header line."""
 
+    with open(metadata_csv, encoding="utf-8", errors="replace") as f:
+        header = f.readline()
+    return max(candidates, key=header.count)
 
-def generate_corhoh_xml(metadata_csv: Path, texts_dir: Path, output_xml: Path) -> None:
-    df = read_metadata(metadata_csv)
 
-    records: List[str] = []
+def read_metadata(metadata_csv: Path) -> List[Dict[str, str]]:
+    """Read the metadata rows as plain string dicts, blanking NA markers.
+
+    As with pandas, a repeated header name keeps its first column. Columns from
+    RECORD_FIELDS that the header lacks are reported here.
+    """
+
+    with open(metadata_csv, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f, delimiter=detect_delimiter(metadata_csv))
+        header = next(reader, None)
+        if not header or "Documents ID" not in header:
+            raise KeyError("Metadata file must contain a 'Documents ID' column.")
+
+        columns: Dict[str, int] = {}
+        for i, name in enumerate(header):
+            if name in columns:
+                logging.warning("Duplicate metadata column '%s'; using the first one.", name)
+            else:
+                columns[name] = i
+        for name in RECORD_FIELDS:
+            if name not in columns:
+                logging.warning("Metadata column '%s' not found; its elements will be empty.", name)
+
+        rows = []
+        for cells in reader:
+            if not cells:
+                continue
+            row = {}
+            for name, i in columns.items():
+                v = cells[i] if i < len(cells) else ""
+                row[name] = "" if v in _NA_VALUES else v
+            rows.append(row)
+    return rows
+
+
+Job = Tuple[Tuple[str, ...], Optional[str]]
+
+
+def _process_one(job: Job) -> Tuple[str, int, int]:
+    """Read one transcript (if any) and build its record; runs in a worker process."""
+
+    values, txt_path = job
+    transcript = smart_read(Path(txt_path)) if txt_path is not None else ""
+    return build_record_xml(values, transcript, "\n")
+
+
+def _build_records(jobs: List[Job], workers: int | None) -> Iterator[Tuple[str, int, int]]:
+    """Yield built records in input order.
+
+    Records are independent, so they are built in a process pool. With a single
+    worker (also the default on a one-CPU machine) they are built in-process,
+    which avoids pool overhead and keeps profilers and PyPy's JIT on the hot loop.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from map(_process_one, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        yield from ex.map(_process_one, jobs, chunksize=16)
+
+
+def generate_corhoh_xml(
+    metadata_csv: Path,
+    texts_dir: Path,
+    output_xml: Path,
+    workers: int | None = None,
+) -> None:
+    rows = read_metadata(metadata_csv)
+
     total_q = 0
     total_a = 0
 
     missing_transcripts = 0
 
-    for i, row in enumerate(df.to_dict(orient="records"), start=1):
-        doc_id = str(row.get("Documents ID", "")).strip()
-        txt_path = texts_dir / f"{doc_id}.txt"
+    # One directory scan instead of a stat() per record.
+    with os.scandir(texts_dir) as it:
+        available = {e.name: e.path for e in it if e.is_file()}
 
-        if not txt_path.exists():
+    jobs: List[Job] = []
+    for row in rows:
+        values = tuple(row.get(name, "") for name in RECORD_FIELDS)
+        doc_id = values[0].strip()
+        txt_name = f"{doc_id}.txt"
+        txt_path = available.get(txt_name)
+
+        if txt_path is None:
             missing_transcripts += 1
-            logging.warning("Missing transcript for Documents ID '%s' (%s)", doc_id, txt_path)
-            transcript = ""
-        else:
-            transcript = smart_read(txt_path)
-
-        rec_xml, q, a = build_record_xml(row, transcript, "\n")
-        records.append(rec_xml)
-        total_q += q
-        total_a += a
-
-        if i % 50 == 0:
-            logging.info("Processed %d/%d records...", i, len(df))
-
-    logging.info("Total questions: %d | Total answers: %d", total_q, total_a)
-    if missing_transcripts:
-        logging.warning("Missing transcripts: %d (records were still created with empty text)", missing_transcripts)
-
-    tei = (
-        "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n"
-        "<TEI xmlns=\"http://www.tei-c.org/ns/1.0\">\n"
-        + fixed_header_block(total_q, total_a, "\n")
-        + f"\n{IND.CORHOH}<CORHOH>\n"
-        + ("\n".join(records) + "\n")
-        + f"{IND.CORHOH}</CORHOH>\n"
-        + "</TEI>\n"
-    )
+            logging.warning("Missing transcript for Documents ID '%s' (%s)", doc_id, texts_dir / txt_name)
+        jobs.append((values, txt_path))
+
+    # The header needs the final Q/A totals, so record bodies are streamed to a
+    # scratch file first and copied after the header once the counts are known.
+    with tempfile.TemporaryFile() as body:
+        for i, (rec_xml, q, a) in enumerate(_build_records(jobs, workers), start=1):
+            body.write(rec_xml.encode("utf-8"))
+            body.write(b"\n")
+            total_q += q
+            total_a += a
+
+            if i % 50 == 0:
+                logging.info("Processed %d/%d records...", i, len(jobs))
+
+        logging.info("Total questions: %d | Total answers: %d", total_q, total_a)
+        if missing_transcripts:
+            logging.warning("Missing transcripts: %d (records were still created with empty text)", missing_transcripts)
+
+        header = (
+            "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n"
+            "<TEI xmlns=\"http://www.tei-c.org/ns/1.0\">\n"
+            + fixed_header_block(total_q, total_a, "\n")
+            + f"\n{_CORHOH}<CORHOH>\n"
+        )
+
+        body.seek(0)
+        with output_xml.open("wb") as f:
+            f.write(header.encode("utf-8"))
+            shutil.copyfileobj(body, f)
+            f.write(f"{_CORHOH}</CORHOH>\n</TEI>\n".encode("utf-8"))
 
-    output_xml.write_text(tei, encoding="utf-8")
     logging.info("Wrote output: %s", output_xml)
 
 
@@ -294,6 +448,7 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     p.add_argument("--metadata", default=DEFAULT_METADATA_CSV, help="Path to metadata CSV")
     p.add_argument("--texts-dir", default=DEFAULT_TEXTS_DIR, help="Directory with transcript .txt files")
     p.add_argument("--output", default=DEFAULT_OUTPUT_XML, help="Output XML path")
+    p.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count; 1 runs in-process)")
     p.add_argument("-v", "--verbose", action="count", default=0, help="Increase logging (-v, -vv)")
     return p.parse_args(argv)
 
@@ -309,11 +464,14 @@ def main(argv: Sequence[str] | None = None) -> int:
     if not metadata_csv.exists():
         logging.error("Metadata file not found: %s", metadata_csv)
         return 2
-    if not texts_dir.exists():
+    if not texts_dir.is_dir():
         logging.error("Texts directory not found: %s", texts_dir)
         return 2
+    if args.workers is not None and args.workers < 1:
+        logging.error("--workers must be at least 1, got %d", args.workers)
+        return 2
 
-    generate_corhoh_xml(metadata_csv, texts_dir, output_xml)
+    generate_corhoh_xml(metadata_csv, texts_dir, output_xml, args.workers)
     return 0
 
 
@@ -0,0 +1,5 @@
+#!/bin/sh
+# Run the CORHOH XML creator under PyPy; arguments are passed through.
+# The script only uses the standard library, so no extra packages are needed.
+set -e
+exec "${PYPY:-pypy3}" "$(dirname "$0")/XML-Creator_CORHOH.py" "$@"